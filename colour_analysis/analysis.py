@@ -175,6 +175,8 @@ class ColourAnalysis(SceneCanvas):
 
         self.unfreeze()
 
+        self._image_cache = {}
+
         self._image = None
         self.image = image if image is not None else DEFAULT_FAILSAFE_IMAGE
         self._image_path = None
@@ -253,11 +255,16 @@ class ColourAnalysis(SceneCanvas):
         """
 
         if value is not None:
-            assert isinstance(value, (tuple, list, np.ndarray, np.matrix)), ((
-                '"{0}" attribute: "{1}" is not a "tuple", "list", "ndarray" '
-                'or "matrix" instance!').format('image', value))
+            assert isinstance(value, (tuple, list, np.ndarray)), ((
+                '"{0}" attribute: "{1}" is not a "tuple", "list" or "ndarray" '
+                'instance!').format('image', value))
+
+            # Converting once here lets the clamped images and the views work
+            # on float32 data without further copies.
+            value = np.ascontiguousarray(value, dtype=np.float32)
 
         self._image = value
+        self._image_cache.clear()
 
         if self._initialised:
             image = self._create_image()
@@ -798,15 +805,31 @@ class ColourAnalysis(SceneCanvas):
         -------
         ndarray
             Image
+
+        Notes
+        -----
+        -   The created images are cached per clamping state, the cache is
+            cleared when :attr:`ColourAnalysis.image` attribute is set.
         """
 
+        key = (self._clamp_blacks, self._clamp_whites)
+
+        image = self._image_cache.get(key)
+        if image is not None:
+            return image
+
         image = self._image
 
-        if self._clamp_blacks:
-            image = np.clip(image, 0, np.inf)
+        # The image is shared with the views and cannot be clamped in place,
+        # each clamping state allocates a single array in a single pass.
+        if self._clamp_blacks and self._clamp_whites:
+            image = np.clip(image, 0, 1)
+        elif self._clamp_blacks:
+            image = np.maximum(image, 0)
+        elif self._clamp_whites:
+            image = np.minimum(image, 1)
 
-        if self._clamp_whites:
-            image = np.clip(image, -np.inf, 1)
+        self._image_cache[key] = image
 
         return image
 
@@ -2,6 +2,6 @@
 
 from __future__ import absolute_import
 
-from .common import CHROMATICITY_DIAGRAM_TRANSFORMATIONS, Cycle
+from .common import CHROMATICITY_DIAGRAM_TRANSFORMATIONS, RGBA_colour, Cycle
 
-__all__ = ['CHROMATICITY_DIAGRAM_TRANSFORMATIONS', 'Cycle']
\ No newline at end of file
+__all__ = ['CHROMATICITY_DIAGRAM_TRANSFORMATIONS', 'RGBA_colour', 'Cycle']
\ No newline at end of file
@@ -9,8 +9,12 @@ Defines the common utilities objects that don't fall in any specific category.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
+from vispy.color.color_array import ColorArray
+
 from colour import (Luv_to_uv, Luv_uv_to_xy, UCS_to_uv, UCS_uv_to_xy,
                     xy_to_XYZ, XYZ_to_Luv, XYZ_to_UCS, XYZ_to_xy)
+from colour.utilities import is_string
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -19,7 +23,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['CHROMATICITY_DIAGRAM_TRANSFORMATIONS', 'Cycle']
+__all__ = ['CHROMATICITY_DIAGRAM_TRANSFORMATIONS', 'RGBA_colour', 'Cycle']
 
 CHROMATICITY_DIAGRAM_TRANSFORMATIONS = {
     'CIE 1931': {
@@ -43,6 +47,58 @@ CHROMATICITY_DIAGRAM_TRANSFORMATIONS : dict
 """
 
 
+_RGBA_COLOUR_CACHE = {}
+"""
+Cache for the *RGBA* colours.
+
+_RGBA_COLOUR_CACHE : dict
+"""
+
+
+def RGBA_colour(colour, alpha=1.0):
+    """
+    Returns the *RGBA* colour array of given colour and alpha as converted by
+    :class:`vispy.color.color_array.ColorArray` class.
+
+    Parameters
+    ----------
+    colour : unicode or array_like
+        Colour name, hexadecimal value or array.
+    alpha : numeric, optional
+        Colour alpha.
+
+    Returns
+    -------
+    ndarray
+        *RGBA* colour array.
+
+    Notes
+    -----
+    -   The conversions of uniform colours, i.e. colour names, hexadecimal
+        values and single *RGB* or *RGBA* colours, are cached per colour and
+        alpha, a copy of the cached array is returned so that it can be
+        modified. Other colour arrays are converted directly.
+
+    Examples
+    --------
+    >>> RGBA_colour((0.5, 0.5, 1.0), 0.5)  # doctest: +SKIP
+    array([[ 0.5,  0.5,  1. ,  0.5]], dtype=float32)
+    """
+
+    if colour is None or is_string(colour):
+        key = (colour, alpha)
+    elif np.shape(colour) in ((3, ), (4, )):
+        key = (tuple(np.ravel(colour)), np.shape(colour), alpha)
+    else:
+        return ColorArray(colour, alpha=alpha).rgba
+
+    RGBA = _RGBA_COLOUR_CACHE.get(key)
+    if RGBA is None:
+        RGBA = _RGBA_COLOUR_CACHE[key] = ColorArray(colour, alpha=alpha).rgba
+
+    return np.copy(RGBA)
+
+
 class Cycle(object):
     """
     Defines a cycling array like container where items can be retrieved
@@ -184,9 +184,9 @@ class DiagramView(ViewBox):
         """
 
         if value is not None:
-            assert isinstance(value, (tuple, list, np.ndarray, np.matrix)), ((
-                '"{0}" attribute: "{1}" is not a "tuple", "list", "ndarray" '
-                'or "matrix" instance!').format('image', value))
+            assert isinstance(value, (tuple, list, np.ndarray)), ((
+                '"{0}" attribute: "{1}" is not a "tuple", "list" or "ndarray" '
+                'instance!').format('image', value))
 
         self._image = value
 
@@ -529,7 +529,8 @@ class DiagramView(ViewBox):
             title += ' - '
             title += 'Whites Clamped'
 
-        self._label.text = title
+        if self._label.text != title:
+            self._label.text = title
 
     def toggle_spectral_locus_visual_visibility_action(self):
         """
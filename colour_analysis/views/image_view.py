@@ -10,17 +10,22 @@ Defines the *Image View* related objects:
 
 from __future__ import division, unicode_literals
 
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from vispy.scene.cameras import PanZoomCamera
 from vispy.scene.widgets import Label, ViewBox, Widget
 
-from colour import (RGB_COLOURSPACES, RGB_to_RGB, RGB_to_XYZ,
+from colour import (RGB_COLOURSPACES, RGB_to_RGB_matrix,
                     is_within_pointer_gamut)
 from colour.utilities import is_string, tstack
 
 from colour_analysis.constants import DEFAULT_ENCODING_CCTF
 from colour_analysis.visuals import image_visual
+from colour_analysis.visuals.pointer_gamut import POINTER_GAMUT_DATA
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -31,6 +36,351 @@ __status__ = 'Production'
 
 __all__ = ['ImageView']
 
+_IMAGE_BAND_SIZE = 2 ** 19
+"""
+Size in bytes of the image bands processed by :class:`ImageView` class, it is
+chosen so that a band and its intermediates stay in the processor caches.
+
+_IMAGE_BAND_SIZE : int
+"""
+
+_IMAGE_THREAD_POOL = ThreadPoolExecutor(os.cpu_count() or 1)
+"""
+Thread pool processing the image bands, it is shared by the
+:class:`ImageView` class instances so that worker threads are not created
+for each of them.
+
+_IMAGE_THREAD_POOL : ThreadPoolExecutor
+"""
+
+
+def _dot_image(M, image):
+    """
+    Applies given *3x3* matrix to given image pixels.
+
+    Parameters
+    ----------
+    M : array_like
+        *3x3* matrix.
+    image : array_like
+        Image to apply the matrix to.
+
+    Returns
+    -------
+    ndarray
+        Transformed image.
+
+    Notes
+    -----
+    -   Flattening the image pixels allows :func:`np.dot` definition to
+        dispatch a single *BLAS* matrix product, it otherwise iterates per
+        pixel when given an array with more than two dimensions.
+    """
+
+    image = np.asarray(image)
+
+    return np.reshape(
+        np.dot(np.reshape(image, (-1, 3)), np.transpose(M)), image.shape)
+
+
+_RGB_TO_RGB_MATRIX_CACHE = {}
+"""
+Cache for the *RGB* colourspace to *RGB* colourspace matrices.
+
+_RGB_TO_RGB_MATRIX_CACHE : dict
+"""
+
+
+def _RGB_to_RGB_matrix(input_colourspace, output_colourspace):
+    """
+    Returns the float32 matrix converting from given input *RGB* colourspace
+    to given output *RGB* colourspace.
+
+    Parameters
+    ----------
+    input_colourspace : unicode
+        :class:`colour.RGB_Colourspace` class instance name defining the
+        input colourspace.
+    output_colourspace : unicode
+        :class:`colour.RGB_Colourspace` class instance name defining the
+        output colourspace.
+
+    Returns
+    -------
+    ndarray
+        Conversion matrix.
+
+    Notes
+    -----
+    -   The matrices are cached per colourspaces pair so that cycling the
+        correlate colourspace or using multiple views does not recompute
+        them.
+    """
+
+    key = (input_colourspace, output_colourspace)
+    M = _RGB_TO_RGB_MATRIX_CACHE.get(key)
+    if M is not None:
+        return M
+
+    M = _RGB_TO_RGB_MATRIX_CACHE[key] = RGB_to_RGB_matrix(
+        RGB_COLOURSPACES[input_colourspace],
+        RGB_COLOURSPACES[output_colourspace]).astype(np.float32)
+
+    return M
+
+
+def _out_of_gamut_table(M):
+    """
+    Returns the table of given matrix applied to the out of gamut colours
+    masks, i.e. the unit cube vertices.
+
+    Parameters
+    ----------
+    M : array_like
+        Matrix to apply.
+
+    Returns
+    -------
+    ndarray
+        Out of gamut colours table indexed by the packed masks.
+
+    Notes
+    -----
+    -   The table is indexed by the masks packed with
+        :func:`_pack_out_of_gamut_mask` definition.
+    """
+
+    masks = (np.arange(8)[:, np.newaxis] >> np.arange(3)) & 1
+
+    return np.dot(masks, np.transpose(M)).astype(np.float32)
+
+
+def _pack_out_of_gamut_mask(mask):
+    """
+    Packs given out of gamut colours mask channels into a single channel of
+    bits.
+
+    Parameters
+    ----------
+    mask : ndarray
+        uint8 out of gamut colours mask.
+
+    Returns
+    -------
+    ndarray
+        Packed mask.
+    """
+
+    packed = np.left_shift(mask[..., 2], 2)
+    packed |= np.left_shift(mask[..., 1], 1)
+    packed |= mask[..., 0]
+
+    return packed
+
+
+_POINTER_GAMUT_TABLE_CACHE = {}
+"""
+Cache for the *Pointer's Gamut* occupancy tables.
+
+_POINTER_GAMUT_TABLE_CACHE : dict
+"""
+
+
+def _pointer_gamut_table(samples=64):
+    """
+    Returns the *Pointer's Gamut* occupancy table sampled over the
+    *Pointer's Gamut* *CIE XYZ* tristimulus values bounding box.
+
+    Parameters
+    ----------
+    samples : int, optional
+        Samples count per axis.
+
+    Returns
+    -------
+    tuple
+        Occupancy table, bounding box minimum and table step.
+
+    Notes
+    -----
+    -   The bounding box is padded with one sample on each side so that
+        values clipped to the table domain are always outside the gamut.
+    -   The occupancy table values are 0 for the samples outside the gamut, 1
+        for the samples inside and 2 for the samples whose neighbours do not
+        all agree, i.e. near the gamut boundary, where the nearest sample is
+        not accurate enough.
+    """
+
+    table = _POINTER_GAMUT_TABLE_CACHE.get(samples)
+    if table is not None:
+        return table
+
+    XYZ_m = np.min(POINTER_GAMUT_DATA, axis=0)
+    XYZ_M = np.max(POINTER_GAMUT_DATA, axis=0)
+    step = (XYZ_M - XYZ_m) / (samples - 3)
+    XYZ_m = XYZ_m - step
+
+    X, Y, Z = [
+        XYZ_m[i] + np.arange(samples) * step[i] for i in range(3)
+    ]
+    within = is_within_pointer_gamut(
+        tstack(np.meshgrid(X, Y, Z, indexing='ij')))
+
+    # The samples with at least one neighbour on the other side of the gamut
+    # boundary are flagged, the padding samples are always outside.
+    padded = np.pad(within, 1, mode='edge')
+    any_within = np.zeros(within.shape, dtype=np.bool_)
+    all_within = np.ones(within.shape, dtype=np.bool_)
+    for i in range(3):
+        for j in range(3):
+            for k in range(3):
+                neighbours = padded[i:i + samples, j:j + samples,
+                                    k:k + samples]
+                any_within |= neighbours
+                all_within &= neighbours
+    boundary = np.logical_and(any_within, np.logical_not(all_within))
+    boundary[[0, -1], :, :] = False
+    boundary[:, [0, -1], :] = False
+    boundary[:, :, [0, -1]] = False
+
+    occupancy = within.astype(np.uint8)
+    occupancy[boundary] = 2
+
+    table = _POINTER_GAMUT_TABLE_CACHE[samples] = (
+        occupancy, XYZ_m.astype(np.float32), step.astype(np.float32))
+
+    return table
+
+
+def _is_within_pointer_gamut_table(RGB, RGB_to_XYZ_matrix):
+    """
+    Returns if given *RGB* colourspace array converted to *CIE XYZ*
+    tristimulus values with given matrix is within *Pointer's Gamut* volume
+    using the nearest sample of the *Pointer's Gamut* occupancy table.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array.
+    RGB_to_XYZ_matrix : array_like
+        *Normalised primary matrix* converting from *RGB* colourspace to
+        *CIE XYZ* tristimulus values.
+
+    Returns
+    -------
+    ndarray
+        Is within *Pointer's Gamut*.
+
+    Notes
+    -----
+    -   The nearest sample is used away from the *Pointer's Gamut* boundary,
+        the colours near it are tested exactly with
+        :func:`colour.is_within_pointer_gamut` definition.
+    -   Non-finite values are outside the *Pointer's Gamut*.
+    -   The table normalisation is folded into the conversion matrix so that
+        the table indexes are computed with a single matrix multiplication
+        instead of materialising the *CIE XYZ* tristimulus values.
+    """
+
+    occupancy, XYZ_m, step = _pointer_gamut_table()
+
+    M = RGB_to_XYZ_matrix / step[:, np.newaxis]
+
+    indexes = _dot_image(M, RGB)
+    indexes -= XYZ_m / step
+    np.rint(indexes, out=indexes)
+    # *NaN* values would be cast to invalid indexes, they are mapped to the
+    # padding samples which are outside the gamut.
+    np.nan_to_num(indexes, copy=False, nan=0)
+    np.clip(indexes, 0, occupancy.shape[0] - 1, out=indexes)
+    indexes = indexes.astype(np.intp)
+
+    within = occupancy[indexes[..., 0], indexes[..., 1], indexes[..., 2]]
+
+    boundary = within == 2
+    if np.any(boundary):
+        within[boundary] = is_within_pointer_gamut(
+            np.dot(RGB[boundary], np.transpose(RGB_to_XYZ_matrix)))
+
+    return within.view(np.bool_)
+
+
+_ENCODING_CCTF_TABLE_CACHE = {}
+"""
+Cache for the encoding colour component transfer function tables.
+
+_ENCODING_CCTF_TABLE_CACHE : dict
+"""
+
+
+def _encoding_cctf_table(colourspace, samples=65536):
+    """
+    Returns the encoding colour component transfer function of given
+    colourspace sampled over domain [0, 1].
+
+    Parameters
+    ----------
+    colourspace : unicode
+        :class:`colour.RGB_Colourspace` class instance name defining the
+        encoding colour component transfer function to sample.
+    samples : int, optional
+        Samples count.
+
+    Returns
+    -------
+    ndarray
+        Encoding colour component transfer function table.
+    """
+
+    key = (colourspace, samples)
+    table = _ENCODING_CCTF_TABLE_CACHE.get(key)
+    if table is not None:
+        return table
+
+    table = _ENCODING_CCTF_TABLE_CACHE[key] = (
+        RGB_COLOURSPACES[colourspace].cctf_encoding(
+            np.linspace(0, 1, samples)).astype(np.float32))
+
+    return table
+
+
+def _encode_image(image, table, out=None, scratch=None):
+    """
+    Encodes given image with given encoding colour component transfer function
+    table using a table lookup.
+
+    Parameters
+    ----------
+    image : array_like
+        Image to encode.
+    table : ndarray
+        Encoding colour component transfer function table as returned by
+        :func:`_encoding_cctf_table` definition.
+    out : ndarray, optional
+        Array to write the encoded image into.
+    scratch : ndarray, optional
+        float32 array used as scratch buffer for the table indexes, it can be
+        given image.
+
+    Returns
+    -------
+    ndarray
+        Encoded image.
+
+    Notes
+    -----
+    -   The image is clipped to domain [0, 1] and the encoded image is thus
+        in the table range, the encoding colour component transfer function
+        is expected to be monotonic and to map 0 and 1 to themselves.
+    """
+
+    indexes = np.multiply(
+        image, table.size - 1, out=scratch, dtype=np.float32)
+    indexes += 0.5
+    np.clip(indexes, 0, table.size - 1, out=indexes)
+
+    return np.take(table, indexes.astype(np.uint16), out=out, mode='clip')
+
 
 class ImageView(ViewBox):
     """
@@ -98,6 +448,17 @@ class ImageView(ViewBox):
 
         self._scene_canvas = scene_canvas
 
+        self._RGB_to_XYZ_matrix = None
+        self._RGB_to_RGB_table = None
+        self._out_of_pointer_gamut_mask = None
+        # The encoded image is quantised to 8-bit by the table so that the
+        # cached images and the texture uploads are four times smaller.
+        self._encoding_cctf_table = np.rint(
+            _encoding_cctf_table(DEFAULT_ENCODING_CCTF) * 255).astype(np.uint8)
+
+        self._image_cache = OrderedDict()
+        self._image_cache_size = 4
+
         self._image = None
         self.image = image
         self._input_colourspace = None
@@ -110,6 +471,10 @@ class ImageView(ViewBox):
         self._label = None
 
         self._image_visual = None
+        self._image_visual_image = None
+        self._image_visual_dirty = False
+
+        self._bands_count = os.cpu_count() or 1
 
         self._image_overlay = True
 
@@ -124,6 +489,9 @@ class ImageView(ViewBox):
 
         self._create_label()
 
+        if self._scene_canvas is not None:
+            self._scene_canvas.events.draw.connect(self._on_draw)
+
         self._initialised = True
 
     @property
@@ -163,16 +531,18 @@ class ImageView(ViewBox):
         """
 
         if value is not None:
-            assert isinstance(value, (tuple, list, np.ndarray, np.matrix)), ((
-                '"{0}" attribute: "{1}" is not a "tuple", "list", "ndarray" '
-                'or "matrix" instance!').format('image', value))
+            assert isinstance(value, (tuple, list, np.ndarray)), ((
+                '"{0}" attribute: "{1}" is not a "tuple", "list" or "ndarray" '
+                'instance!').format('image', value))
+
+            value = np.ascontiguousarray(value, dtype=np.float32)
 
         self._image = value
+        self._image_cache.clear()
+        self._out_of_pointer_gamut_mask = None
 
         if self._initialised:
-            self._detach_visuals()
-            self._create_visuals()
-            self._attach_visuals()
+            self._update_visuals()
             self._label_text()
 
     @property
@@ -209,11 +579,14 @@ class ImageView(ViewBox):
                     sorted(RGB_COLOURSPACES.keys())))
 
         self._input_colourspace = value
+        self._RGB_to_XYZ_matrix = (
+            RGB_COLOURSPACES[value].RGB_to_XYZ_matrix.astype(np.float32)
+            if value is not None else None)
+        self._RGB_to_RGB_table = None
+        self._out_of_pointer_gamut_mask = None
 
         if self._initialised:
-            self._detach_visuals()
-            self._create_visuals()
-            self._attach_visuals()
+            self._update_visuals()
             self._label_text()
 
     @property
@@ -250,11 +623,10 @@ class ImageView(ViewBox):
                     sorted(RGB_COLOURSPACES.keys())))
 
         self._correlate_colourspace = value
+        self._RGB_to_RGB_table = None
 
         if self._initialised:
-            self._detach_visuals()
-            self._create_visuals()
-            self._attach_visuals()
+            self._update_visuals()
             self._label_text()
 
     def _create_image(self):
@@ -269,52 +641,234 @@ class ImageView(ViewBox):
         -------
         ndarray
             Image
+
+        Notes
+        -----
+        -   The image is split in horizontal bands processed concurrently by
+            :meth:`ImageView._create_image_band` method, *NumPy* releasing the
+            *GIL* during the array operations. The bands are at most
+            :attr:`_IMAGE_BAND_SIZE` attribute bytes large so that the whole
+            pipeline runs on each band while it is cache resident.
+        -   The last created images are cached according to the attributes
+            values they depend on, the cache is cleared when
+            :attr:`ImageView.image` attribute is set.
+        """
+
+        has_overlay = (self._display_input_colourspace_out_of_gamut
+                       or self._display_correlate_colourspace_out_of_gamut
+                       or self._display_out_of_pointer_gamut)
+
+        # The image overlay only affects the image when an overlay is
+        # displayed, keying on it otherwise would recreate identical images.
+        key = (self._display_input_colourspace_out_of_gamut,
+               self._display_correlate_colourspace_out_of_gamut,
+               self._display_out_of_pointer_gamut, self._display_hdr_colours,
+               self._image_overlay and has_overlay, self._input_colourspace
+               if (self._display_correlate_colourspace_out_of_gamut
+                   or self._display_out_of_pointer_gamut) else None,
+               self._correlate_colourspace
+               if self._display_correlate_colourspace_out_of_gamut else None)
+
+        image = self._image_cache.get(key)
+        if image is not None:
+            self._image_cache.move_to_end(key)
+
+            return image
+
+        if (self._display_correlate_colourspace_out_of_gamut
+                and self._RGB_to_RGB_table is None):
+            self._RGB_to_RGB_table = _out_of_gamut_table(
+                _RGB_to_RGB_matrix(self._input_colourspace,
+                                   self._correlate_colourspace))
+
+        # Building the table before dispatching the bands prevents the
+        # threads from building it concurrently.
+        if self._display_out_of_pointer_gamut:
+            _pointer_gamut_table()
+
+        bands_count = max(self._bands_count,
+                          int(np.ceil(self._image.nbytes / _IMAGE_BAND_SIZE)))
+        rows = np.linspace(0, self._image.shape[0],
+                           bands_count + 1).astype(np.int_)
+        bands = [slice(rows[i], rows[i + 1]) for i in range(len(rows) - 1)]
+
+        # The out of *Pointer's Gamut* colours mask of the image only depends
+        # on the image and the input colourspace, it is thus created once and
+        # reused, e.g. when toggling the image overlay.
+        mask = None
+        if (self._display_out_of_pointer_gamut
+                and not self._display_input_colourspace_out_of_gamut
+                and not self._display_correlate_colourspace_out_of_gamut):
+            if self._out_of_pointer_gamut_mask is None:
+                self._out_of_pointer_gamut_mask = (
+                    self._create_out_of_pointer_gamut_mask(bands))
+
+            mask = self._out_of_pointer_gamut_mask
+
+        image = np.empty(self._image.shape, dtype=np.uint8)
+
+        def create_image_band(band):
+            self._create_image_band(self._image[band], image[band],
+                                    mask[band] if mask is not None else None)
+
+        list(_IMAGE_THREAD_POOL.map(create_image_band, bands))
+
+        self._image_cache[key] = image
+        if len(self._image_cache) > self._image_cache_size:
+            self._image_cache.popitem(last=False)
+
+        return image
+
+    def _create_out_of_pointer_gamut_mask(self, bands):
+        """
+        Creates the out of *Pointer's Gamut* colours mask of
+        :attr:`ImageView.image` attribute value.
+
+        Parameters
+        ----------
+        bands : list
+            Horizontal bands slices the mask is created with concurrently.
+
+        Returns
+        -------
+        ndarray
+            uint8 out of *Pointer's Gamut* colours mask.
+        """
+
+        mask = np.empty(self._image.shape[:-1], dtype=np.uint8)
+
+        def create_mask_band(band):
+            np.logical_not(
+                _is_within_pointer_gamut_table(self._image[band],
+                                               self._RGB_to_XYZ_matrix),
+                out=mask[band].view(np.bool_))
+
+        list(_IMAGE_THREAD_POOL.map(create_mask_band, bands))
+
+        return mask
+
+    def _create_image_band(self, image, output, mask=None):
+        """
+        Creates given image band according to
+        :attr:`GamutView._display_input_colourspace_out_of_gamut`,
+        :attr:`GamutView._display_correlate_colourspace_out_of_gamut`,
+        :attr:`GamutView._display_out_of_pointer_gamut` and
+        :attr:`GamutView._display_hdr_colours` attributes values.
+
+        Parameters
+        ----------
+        image : ndarray
+            :attr:`ImageView.image` attribute value band.
+        output : ndarray
+            uint8 array the encoded image band is written into.
+        mask : ndarray, optional
+            uint8 out of *Pointer's Gamut* colours mask band, it is created
+            from the image band if not given.
+
+        Returns
+        -------
+        ndarray
+            Image band.
+
+        Notes
+        -----
+        -   The branches do not mutate the image in place so that
+            :attr:`ImageView.image` attribute value does not need to be
+            copied, they write into a float32 scratch buffer of the band size
+            instead.
         """
 
-        image = np.copy(self._image)
+        band = image
+        scratch = np.empty(image.shape, dtype=np.float32)
 
         has_overlay = False
         if (self._display_input_colourspace_out_of_gamut
                 or self._display_correlate_colourspace_out_of_gamut):
-            image[image >= 0] = 0
-            image[image < 0] = 1
+            image = np.less(image, 0).view(np.uint8)
             has_overlay = True
 
         if self._display_correlate_colourspace_out_of_gamut:
-            image = RGB_to_RGB(image,
-                               RGB_COLOURSPACES[self._input_colourspace],
-                               RGB_COLOURSPACES[self._correlate_colourspace])
+            # The mask only takes the unit cube vertices values, the
+            # converted colours are thus looked up instead of computed.
+            image = np.take(
+                self._RGB_to_RGB_table,
+                _pack_out_of_gamut_mask(image),
+                axis=0,
+                out=scratch)
             has_overlay = True
 
         if self._display_out_of_pointer_gamut:
-            colourspace = RGB_COLOURSPACES[self._input_colourspace]
-            image = is_within_pointer_gamut(
-                RGB_to_XYZ(image, colourspace.whitepoint,
-                           colourspace.whitepoint,
-                           colourspace.RGB_to_XYZ_matrix)).astype(int)
-
-            # TODO: Investigate why stacking implies that image needs to be
-            # inverted.
-            image = 1 - tstack([image, image, image])
+            if mask is None:
+                mask = np.logical_not(
+                    _is_within_pointer_gamut_table(
+                        image, self._RGB_to_XYZ_matrix)).view(np.uint8)
+
+            # Broadcasting the single channel mask avoids materialising the
+            # three channels copies.
+            image = np.broadcast_to(mask[..., np.newaxis], image.shape)
             has_overlay = True
 
         if self._display_hdr_colours:
-            image[image <= 1] = 0
+            image = np.multiply(image, image > 1, out=scratch)
             # has_overlay = True
 
         if self._image_overlay and has_overlay:
-            image = self._image + image
-
-        oecf = RGB_COLOURSPACES[DEFAULT_ENCODING_CCTF].cctf_encoding
+            image = np.add(band, image, out=scratch)
+        elif image.dtype == np.uint8:
+            # Binary masks are encoded to the table range ends, the table
+            # lookup is not needed.
+            return np.multiply(
+                image, self._encoding_cctf_table[-1], out=output)
 
-        return oecf(image)
+        return _encode_image(
+            image, self._encoding_cctf_table, out=output, scratch=scratch)
 
     def _create_visuals(self):
         """
         Creates the *Image View* visuals.
         """
 
-        self._image_visual = image_visual(self._create_image())
+        self._image_visual_image = self._create_image()
+        self._image_visual = image_visual(
+            self._image_visual_image, clim=(0, 255))
+
+    def _update_visuals(self):
+        """
+        Flags the *Image View* visuals for update, the image is created on the
+        next scene canvas draw so that consecutive changes are batched.
+        """
+
+        self._image_visual_dirty = True
+
+        if self._scene_canvas is None:
+            self._on_draw()
+        else:
+            self._scene_canvas.update()
+
+    def _on_draw(self, event=None):
+        """
+        Updates the *Image View* image visual data in place if it has been
+        flagged for update.
+
+        Parameters
+        ----------
+        event : Object, optional
+            Event.
+        """
+
+        if not self._image_visual_dirty:
+            return
+
+        self._image_visual_dirty = False
+
+        # Cached images are returned as the same object, an unchanged image
+        # does not need to be uploaded again.
+        image = self._create_image()
+        if image is self._image_visual_image:
+            return
+
+        self._image_visual_image = image
+        self._image_visual.set_data(image)
 
     def _create_camera(self):
         """
@@ -357,21 +911,26 @@ class ImageView(ViewBox):
         Sets the label text.
         """
 
-        self._label.text = str()
+        title = ''
 
         if self._display_input_colourspace_out_of_gamut:
-            self._label.text = ('{0} - Out of Gamut Colours Display'.format(
-                self._input_colourspace))
+            title = '{0} - Out of Gamut Colours Display'.format(
+                self._input_colourspace)
 
         if self._display_correlate_colourspace_out_of_gamut:
-            self._label.text = ('{0} - Out of Gamut Colours Display'.format(
-                self._correlate_colourspace))
+            title = '{0} - Out of Gamut Colours Display'.format(
+                self._correlate_colourspace)
 
         if self._display_out_of_pointer_gamut:
-            self._label.text = ('Out of Pointer\'s Gamut ' 'Colours Display')
+            title = 'Out of Pointer\'s Gamut Colours Display'
 
         if self._display_hdr_colours:
-            self._label.text = 'HDR Colours Display'
+            title = 'HDR Colours Display'
+
+        # Setting the text triggers the glyphs layout, it is only set when it
+        # changes.
+        if self._label.text != title:
+            self._label.text = title
 
     def toggle_input_colourspace_out_of_gamut_colours_display_action(self):
         """
@@ -384,14 +943,12 @@ class ImageView(ViewBox):
             Definition success.
         """
 
-        self._detach_visuals()
         self._display_input_colourspace_out_of_gamut = (
             not self._display_input_colourspace_out_of_gamut)
         if self._display_input_colourspace_out_of_gamut:
             self._display_correlate_colourspace_out_of_gamut = False
             self._display_hdr_colours = False
-        self._create_visuals()
-        self._attach_visuals()
+        self._update_visuals()
         self._label_text()
 
         return True
@@ -407,15 +964,13 @@ class ImageView(ViewBox):
             Definition success.
         """
 
-        self._detach_visuals()
         self._display_correlate_colourspace_out_of_gamut = (
             not self._display_correlate_colourspace_out_of_gamut)
         if self._display_correlate_colourspace_out_of_gamut:
             self._display_input_colourspace_out_of_gamut = False
             self._display_out_of_pointer_gamut = False
             self._display_hdr_colours = False
-        self._create_visuals()
-        self._attach_visuals()
+        self._update_visuals()
         self._label_text()
 
         return True
@@ -431,15 +986,13 @@ class ImageView(ViewBox):
             Definition success.
         """
 
-        self._detach_visuals()
         self._display_out_of_pointer_gamut = (
             not self._display_out_of_pointer_gamut)
         if self._display_out_of_pointer_gamut:
             self._display_input_colourspace_out_of_gamut = False
             self._display_correlate_colourspace_out_of_gamut = False
             self._display_hdr_colours = False
-        self._create_visuals()
-        self._attach_visuals()
+        self._update_visuals()
         self._label_text()
 
         return True
@@ -454,14 +1007,12 @@ class ImageView(ViewBox):
             Definition success.
         """
 
-        self._detach_visuals()
         self._display_hdr_colours = (not self._display_hdr_colours)
         if self._display_hdr_colours:
             self._display_input_colourspace_out_of_gamut = False
             self._display_correlate_colourspace_out_of_gamut = False
             self._display_out_of_pointer_gamut = False
-        self._create_visuals()
-        self._attach_visuals()
+        self._update_visuals()
         self._label_text()
 
         return True
@@ -478,9 +1029,7 @@ class ImageView(ViewBox):
         """
 
         self._image_overlay = not self._image_overlay
-        self._detach_visuals()
-        self._create_visuals()
-        self._attach_visuals()
+        self._update_visuals()
         self._label_text()
 
     def fit_image_visual_image_action(self):
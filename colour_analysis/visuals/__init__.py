@@ -5,7 +5,7 @@ from __future__ import absolute_import
 from .primitive import Primitive, PrimitiveVisual
 from .symbol import Symbol
 from .axis import axis_visual
-from .box import Box, BoxVisual
+from .box import box_geometry, Box, BoxVisual
 from .diagrams import (CIE_1931_chromaticity_diagram,
                        CIE_1960_UCS_chromaticity_diagram,
                        CIE_1976_UCS_chromaticity_diagram)
@@ -24,7 +24,7 @@ __all__ = []
 __all__ += ['Primitive', 'PrimitiveVisual']
 __all__ += ['Symbol']
 __all__ += ['Axis', 'AxisVisual', 'axis_visual']
-__all__ += ['Box', 'BoxVisual']
+__all__ += ['box_geometry', 'Box', 'BoxVisual']
 __all__ += [
     'CIE_1931_chromaticity_diagram', 'CIE_1960_UCS_chromaticity_diagram',
     'CIE_1976_UCS_chromaticity_diagram'
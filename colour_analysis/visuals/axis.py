@@ -12,7 +12,7 @@ Defines the *Axis Visual*:
 from __future__ import division, unicode_literals
 
 from vispy.scene.visuals import XYZAxis
-from vispy.visuals.transforms import MatrixTransform
+from vispy.visuals.transforms import STTransform
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -44,8 +44,9 @@ def axis_visual(scale=1.0, parent=None):
 
     axis = XYZAxis(parent=parent)
 
-    transform = MatrixTransform()
-    transform.scale((scale, scale, scale))
-    axis.transform = transform
+    # The default identity transform is kept for unit scale, a scale only
+    # transform is cheaper to map than a full matrix one otherwise.
+    if scale != 1:
+        axis.transform = STTransform(scale=(scale, scale, scale))
 
     return axis
@@ -6,11 +6,13 @@ Box Visual
 
 Defines the *Box Visual*:
 
+-   :func:`box_geometry`
 -   :class:`BoxVisual`
 """
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 from vispy.geometry.generation import create_box
 from vispy.scene.visuals import create_visual_node
 
@@ -23,7 +25,72 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['BoxVisual', 'Box']
+__all__ = ['box_geometry', 'BoxVisual', 'Box']
+
+_BOX_GEOMETRY_CACHE = {}
+"""
+Cache for the box geometries.
+
+_BOX_GEOMETRY_CACHE : dict
+"""
+
+
+def box_geometry(width=1,
+                 height=1,
+                 depth=1,
+                 width_segments=1,
+                 height_segments=1,
+                 depth_segments=1,
+                 planes=None):
+    """
+    Returns the box geometry generated by
+    :func:`vispy.geometry.generation.create_box` definition with given
+    parameters.
+
+    Parameters
+    ----------
+    width : numeric, optional
+        Box width.
+    height : numeric, optional
+        Box height.
+    depth : numeric, optional
+        Box depth.
+    width_segments : int, optional
+        Box segments count along the width.
+    height_segments : int, optional
+        Box segments count along the height.
+    depth_segments : int, optional
+        Box segments count along the depth.
+    planes: array_like, optional
+        Any combination of ``{'-x', '+x', '-y', '+y', '-z', '+z'}``
+
+        Included planes in the box construction.
+
+    Returns
+    -------
+    tuple
+        Vertices, faces and outline.
+
+    Notes
+    -----
+    -   The geometries are cached per parameters and their arrays are
+        read-only, they must be copied before being mutated.
+    """
+
+    key = (width, height, depth, width_segments, height_segments,
+           depth_segments, tuple(planes) if planes is not None else None)
+    geometry = _BOX_GEOMETRY_CACHE.get(key)
+    if geometry is not None:
+        return geometry
+
+    geometry = create_box(width, height, depth, width_segments,
+                          height_segments, depth_segments, planes)
+    for array in geometry:
+        array.setflags(write=False)
+
+    _BOX_GEOMETRY_CACHE[key] = geometry
+
+    return geometry
 
 
 class BoxVisual(PrimitiveVisual):
@@ -59,11 +126,16 @@ class BoxVisual(PrimitiveVisual):
         Use wireframe display.
     wireframe_offset : array_like, optional
         Wireframe offset.
+    positions : array_like, optional
+        Box vertices positions overriding the generated ones, e.g. converted
+        *RGB* identity cube vertices.
 
     Notes
     -----
     -   `vertex_colours` argument takes precedence over `uniform_colour` if
         provided.
+    -   `positions` argument must match the generated vertices count and is
+        used as is by the mesh.
     -   `uniform_opacity` argument will be stacked to `vertex_colours` argument
         if the latter last dimension is equal to 3.
     """
@@ -80,12 +152,17 @@ class BoxVisual(PrimitiveVisual):
                  uniform_opacity=1.0,
                  vertex_colours=None,
                  wireframe=False,
-                 wireframe_offset=None):
-        vertices, faces, outline = create_box(width, height, depth,
-                                              width_segments, height_segments,
-                                              depth_segments, planes)
+                 wireframe_offset=None,
+                 positions=None):
+        vertices, faces, outline = box_geometry(
+            width, height, depth, width_segments, height_segments,
+            depth_segments, planes)
+
+        # The mesh owns its vertices which can be modified afterwards.
+        if positions is None:
+            positions = np.copy(vertices['position'])
 
-        PrimitiveVisual.__init__(self, vertices['position'], outline
+        PrimitiveVisual.__init__(self, positions, outline
                                  if wireframe else faces, uniform_colour,
                                  uniform_opacity, vertex_colours, wireframe,
                                  wireframe_offset)
@@ -24,7 +24,7 @@ __status__ = 'Production'
 __all__ = ['image_visual']
 
 
-def image_visual(image, parent=None):
+def image_visual(image, parent=None, clim=(0, 1)):
     """
     Returns a :class:`vispy.scene.visuals.Image` class instance using given
     image.
@@ -35,6 +35,11 @@ def image_visual(image, parent=None):
         Image.
     parent : Node, optional
         Parent of the image visual in the `SceneGraph`.
+    clim : array_like, optional
+        Image values range mapped to the display range, fixing it prevents
+        the image extrema from being computed on every texture upload. The
+        image is clipped to that range unless it is an *uint8* image already
+        contained within it.
 
     Returns
     -------
@@ -42,6 +47,11 @@ def image_visual(image, parent=None):
         Image visual.
     """
 
-    image = np.clip(image, 0, 1)
+    image = np.asarray(image)
 
-    return Image(image, parent=parent)
+    # Clipping copies the whole image, *uint8* images cannot exceed a range
+    # spanning [0, 255] and are passed as is.
+    if not (image.dtype == np.uint8 and clim[0] <= 0 and clim[1] >= 255):
+        image = np.clip(image, clim[0], clim[1])
+
+    return Image(image, parent=parent, clim=clim)
@@ -14,7 +14,6 @@ Defines the *Pointer's Gamut*:
 from __future__ import division, unicode_literals
 
 import numpy as np
-from vispy.color.color_array import ColorArray
 from vispy.scene.visuals import Line, Node
 
 from colour import (Lab_to_XYZ, LCHab_to_Lab, POINTER_GAMUT_BOUNDARIES,
@@ -23,6 +22,7 @@ from colour.models import XYZ_to_colourspace_model
 from colour.plotting.volume import colourspace_model_axis_reorder
 
 from colour_analysis.constants import DEFAULT_PLOTTING_ILLUMINANT
+from colour_analysis.utilities import RGBA_colour
 from colour_analysis.visuals import Symbol
 
 __author__ = 'Colour Developers'
@@ -96,8 +96,8 @@ def pointer_gamut_visual(reference_colourspace='CIE xyY',
         XYZ_to_colourspace_model(POINTER_GAMUT_DATA, POINTER_GAMUT_ILLUMINANT,
                                  reference_colourspace), reference_colourspace)
 
-    RGB = ColorArray(uniform_colour, alpha=uniform_opacity).rgba
-    RGB_e = ColorArray(uniform_edge_colour, alpha=uniform_edge_opacity).rgba
+    RGB = RGBA_colour(uniform_colour, uniform_opacity)
+    RGB_e = RGBA_colour(uniform_edge_colour, uniform_edge_opacity)
 
     markers = Symbol(
         symbol='cross',
@@ -149,9 +149,9 @@ def pointer_gamut_boundaries_visual(reference_colourspace='CIE xyY',
     points = colourspace_model_axis_reorder(
         XYZ_to_colourspace_model(XYZ, illuminant, reference_colourspace),
         reference_colourspace)
-    points[np.isnan(points)] = 0
+    np.nan_to_num(points, copy=False)
 
-    RGB = ColorArray(uniform_colour, alpha=uniform_opacity).rgba
+    RGB = RGBA_colour(uniform_colour, uniform_opacity)
 
     line = Line(points, RGB, width=width, method='agg', parent=parent)
 
@@ -200,9 +200,9 @@ def pointer_gamut_hull_visual(reference_colourspace='CIE xyY',
                 POINTER_GAMUT_ILLUMINANT, reference_colourspace),
             reference_colourspace)
 
-        points[np.isnan(points)] = 0
+        np.nan_to_num(points, copy=False)
 
-        RGB = ColorArray(uniform_colour, alpha=uniform_opacity).rgba
+        RGB = RGBA_colour(uniform_colour, uniform_opacity)
 
         Line(points, RGB, width=width, parent=node)
     return node
@@ -13,13 +13,14 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from vispy.color.color_array import ColorArray
 from vispy.gloo import set_state
 from vispy.scene.visuals import create_visual_node
 from vispy.visuals.mesh import MeshVisual
 
 from colour.constants import DEFAULT_FLOAT_DTYPE
 
+from colour_analysis.utilities import RGBA_colour
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
 __license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
@@ -72,14 +73,17 @@ class PrimitiveVisual(MeshVisual):
         self._wireframe_offset = wireframe_offset
         mode = 'lines' if self._wireframe else 'triangles'
 
-        uniform_colour = ColorArray(uniform_colour, alpha=uniform_opacity).rgba
+        uniform_colour = RGBA_colour(uniform_colour, uniform_opacity)
         if vertex_colours is not None:
             if vertex_colours.shape[-1] == 3:
                 vertex_colours = np.hstack(
                     (vertex_colours,
                      np.full((vertex_colours.shape[0], 1), uniform_opacity,
                              DEFAULT_FLOAT_DTYPE)))
-            else:
+            elif np.any(vertex_colours[..., 3] != uniform_opacity):
+                # The given vertex colours are not modified in place as they
+                # can be shared, e.g. by cached geometries.
+                vertex_colours = np.copy(vertex_colours)
                 vertex_colours[..., 3] = uniform_opacity
 
         MeshVisual.__init__(
@@ -13,10 +13,9 @@ Defines the *RGB Colourspace Visuals*:
 from __future__ import division, unicode_literals
 
 import numpy as np
-from vispy.geometry.generation import create_box
 from vispy.scene.visuals import Node, Line
 
-from colour import RGB_to_XYZ, xy_to_XYZ
+from colour import xy_to_XYZ
 from colour.models import XYZ_to_colourspace_model
 from colour.plotting import filter_RGB_colourspaces
 from colour.plotting.volume import colourspace_model_axis_reorder
@@ -24,7 +23,7 @@ from colour.utilities import first_item
 
 from colour_analysis.constants import DEFAULT_PLOTTING_ILLUMINANT
 from colour_analysis.utilities import CHROMATICITY_DIAGRAM_TRANSFORMATIONS
-from colour_analysis.visuals import Box
+from colour_analysis.visuals import Box, box_geometry
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -39,6 +38,78 @@ __all__ = [
 ]
 
 
+_RGB_COLOURSPACE_TRIANGLE_INDEXES = np.array([2, 0, 1, 2, 0])
+"""
+Indexes of the *RGB* colourspace primaries forming the triangle polyline,
+the extra leading and trailing primaries work around the *agg* line method
+issues.
+
+_RGB_COLOURSPACE_TRIANGLE_INDEXES : ndarray
+"""
+
+_RGB_COLOURSPACE_VOLUME_VERTICES_CACHE = {}
+"""
+Cache for the *RGB* colourspace volume vertices.
+
+_RGB_COLOURSPACE_VOLUME_VERTICES_CACHE : dict
+"""
+
+
+def _RGB_colourspace_volume_vertices(colourspace, reference_colourspace,
+                                     segments):
+    """
+    Returns the vertices of the *RGB* identity cube of given segments count
+    converted from given *RGB* colourspace to given reference colourspace.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace of the *RGB* identity cube.
+    reference_colourspace : unicode
+        Reference colourspace to convert the *CIE XYZ* tristimulus values to.
+    segments : int
+        *RGB* identity cube segments.
+
+    Returns
+    -------
+    ndarray
+        *RGB* colourspace volume vertices.
+
+    Notes
+    -----
+    -   The vertices are cached per *RGB* colourspace *Normalised primary
+        matrix* and whitepoint, reference colourspace and segments count, the
+        returned array is shared and must be copied before being modified.
+    """
+
+    # The colourspace data rather than its name is used so that colourspaces
+    # sharing a name but not their primaries or whitepoint are not mixed.
+    key = (np.asarray(colourspace.RGB_to_XYZ_matrix,
+                      dtype=np.float64).tobytes(),
+           np.asarray(colourspace.whitepoint, dtype=np.float64).tobytes(),
+           reference_colourspace, segments)
+    value = _RGB_COLOURSPACE_VOLUME_VERTICES_CACHE.get(key)
+    if value is not None:
+        return value
+
+    vertices, _faces, _outline = box_geometry(
+        width_segments=segments,
+        height_segments=segments,
+        depth_segments=segments)
+
+    XYZ = np.dot(vertices['position'] + 0.5,
+                 np.transpose(colourspace.RGB_to_XYZ_matrix))
+    value = colourspace_model_axis_reorder(
+        XYZ_to_colourspace_model(XYZ, colourspace.whitepoint,
+                                 reference_colourspace), reference_colourspace)
+    np.nan_to_num(value, copy=False)
+
+    value = _RGB_COLOURSPACE_VOLUME_VERTICES_CACHE[key] = (
+        np.ascontiguousarray(value, dtype=np.float32))
+
+    return value
+
+
 def RGB_identity_cube(width_segments=16,
                       height_segments=16,
                       depth_segments=16,
@@ -84,13 +155,16 @@ def RGB_identity_cube(width_segments=16,
         constructor.
     """
 
-    vertices, _faces, _outline = create_box(
+    vertices, _faces, _outline = box_geometry(
         width_segments=width_segments,
         height_segments=height_segments,
         depth_segments=depth_segments,
         planes=planes)
 
-    vertex_colours = vertices['color'] if vertex_colours else None
+    # The geometry is cached and read-only, slicing the *RGB* channels makes
+    # the primitive stack the opacity into a new array and the translated
+    # positions are a new array owned by the mesh.
+    vertex_colours = vertices['color'][..., 0:3] if vertex_colours else None
 
     RGB_box = Box(
         width_segments=width_segments,
@@ -102,13 +176,10 @@ def RGB_identity_cube(width_segments=16,
         vertex_colours=vertex_colours,
         wireframe=wireframe,
         wireframe_offset=(1, 1),
+        positions=vertices['position'] + 0.5,
         *args,
         **kwargs)
 
-    vertices = RGB_box.mesh_data.get_vertices()
-    vertices += 0.5
-    RGB_box.mesh_data.set_vertices(vertices)
-
     return RGB_box
 
 
@@ -165,36 +236,40 @@ def RGB_colourspace_volume_visual(colourspace='ITU-R BT.709',
 
     colourspace = first_item(filter_RGB_colourspaces(colourspace).values())
 
-    RGB_cube_f = RGB_identity_cube(
+    vertices, _faces, _outline = box_geometry(
         width_segments=segments,
+        height_segments=segments,
+        depth_segments=segments)
+
+    # The converted vertices are given to the boxes directly so that the
+    # meshes are not rebuilt.
+    vertex_colours = vertices['color'][..., 0:3]
+
+    value = np.copy(
+        _RGB_colourspace_volume_vertices(colourspace, reference_colourspace,
+                                         segments))
+
+    Box(width_segments=segments,
         height_segments=segments,
         depth_segments=segments,
         uniform_colour=uniform_colour,
         uniform_opacity=uniform_opacity,
-        vertex_colours=not uniform_colour,
+        vertex_colours=None if uniform_colour else vertex_colours,
+        wireframe_offset=(1, 1),
+        positions=value,
         parent=node)
 
-    vertices = RGB_cube_f.mesh_data.get_vertices()
-    XYZ = RGB_to_XYZ(vertices, colourspace.whitepoint, colourspace.whitepoint,
-                     colourspace.RGB_to_XYZ_matrix)
-    value = colourspace_model_axis_reorder(
-        XYZ_to_colourspace_model(XYZ, colourspace.whitepoint,
-                                 reference_colourspace), reference_colourspace)
-    value[np.isnan(value)] = 0
-
-    RGB_cube_f.mesh_data.set_vertices(value)
-
     if wireframe:
-        RGB_cube_w = RGB_identity_cube(
-            width_segments=segments,
+        Box(width_segments=segments,
             height_segments=segments,
             depth_segments=segments,
             uniform_colour=wireframe_colour,
             uniform_opacity=wireframe_opacity,
-            vertex_colours=not wireframe_colour,
+            vertex_colours=None if wireframe_colour else vertex_colours,
             wireframe=True,
+            wireframe_offset=(1, 1),
+            positions=value,
             parent=node)
-        RGB_cube_w.mesh_data.set_vertices(value)
 
     return node
 
@@ -290,9 +365,9 @@ def RGB_colourspace_triangle_visual(colourspace='ITU-R BT.709',
 
     ij = XYZ_to_ij(xy_to_XYZ(colourspace.primaries), illuminant)
     # TODO: Remove following hack dealing with 'agg' method issues.
-    ij = np.vstack([ij[-1, ...], ij, ij[0, ...]])
+    ij = ij[_RGB_COLOURSPACE_TRIANGLE_INDEXES]
 
-    ij[np.isnan(ij)] = 0
+    np.nan_to_num(ij, copy=False)
 
     RGB = np.hstack([uniform_colour, uniform_opacity])
 
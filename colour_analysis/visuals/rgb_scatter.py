@@ -12,15 +12,13 @@ Defines the *RGB Scatter Visual*:
 from __future__ import division, unicode_literals
 
 import numpy as np
-from vispy.color.color_array import ColorArray
 
-from colour import RGB_to_XYZ
-from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models import XYZ_to_colourspace_model
 from colour.plotting import filter_RGB_colourspaces
 from colour.plotting.volume import colourspace_model_axis_reorder
 from colour.utilities import first_item
 
+from colour_analysis.utilities import RGBA_colour
 from colour_analysis.visuals import Symbol
 
 __author__ = 'Colour Developers'
@@ -102,31 +100,36 @@ def RGB_scatter_visual(RGB,
     if resampling == 'auto':
         resampling = max(int((0.0078125 * np.average(RGB.shape[0:1])) // 2), 1)
 
-        RGB = RGB[::resampling, ::resampling].reshape([-1, 3])
+        RGB = RGB[::resampling, ::resampling]
 
-    XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, colourspace.whitepoint,
-                     colourspace.RGB_to_XYZ_matrix)
+    # A contiguous float32 array is reshaped without copy and matches the
+    # vispy buffers format.
+    RGB = np.ascontiguousarray(RGB, dtype=np.float32).reshape([-1, 3])
+
+    # The input and output illuminants are the same, no chromatic adaptation
+    # is involved and the conversion reduces to the *Normalised primary
+    # matrix*, applied with a single matrix multiplication.
+    XYZ = np.dot(RGB, np.transpose(colourspace.RGB_to_XYZ_matrix))
 
     points = colourspace_model_axis_reorder(
         XYZ_to_colourspace_model(XYZ, colourspace.whitepoint,
                                  reference_colourspace), reference_colourspace)
 
-    points[np.isnan(points)] = 0
-
-    RGB = np.clip(RGB, 0, 1)
+    np.nan_to_num(points, copy=False)
+    points = np.ascontiguousarray(points, dtype=np.float32)
 
     if uniform_colour is None:
-        RGB = np.hstack([RGB,
-                         np.full((RGB.shape[0], 1), uniform_opacity,
-                                 DEFAULT_FLOAT_DTYPE)])
+        RGBA = np.empty((RGB.shape[0], 4), dtype=np.float32)
+        np.clip(RGB, 0, 1, out=RGBA[..., 0:3])
+        RGBA[..., 3] = uniform_opacity
+        RGB = RGBA
     else:
-        RGB = ColorArray(uniform_colour, alpha=uniform_opacity).rgba
+        RGB = RGBA_colour(uniform_colour, uniform_opacity)
 
     if uniform_edge_colour is None:
         RGB_e = RGB
     else:
-        RGB_e = ColorArray(
-            uniform_edge_colour, alpha=uniform_edge_opacity).rgba
+        RGB_e = RGBA_colour(uniform_edge_colour, uniform_edge_opacity)
 
     markers = Symbol(
         symbol=symbol,
@@ -13,7 +13,6 @@ Defines the *Spectral Locus Visual* and related visuals:
 from __future__ import division, unicode_literals
 
 import numpy as np
-from vispy.color.color_array import ColorArray
 from vispy.scene.visuals import Line, Node
 
 from colour import XYZ_to_sRGB
@@ -25,6 +24,7 @@ from colour.plotting.volume import colourspace_model_axis_reorder
 from colour.utilities import first_item
 
 from colour_analysis.constants import DEFAULT_PLOTTING_ILLUMINANT
+from colour_analysis.utilities import RGBA_colour
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -35,6 +35,83 @@ __status__ = 'Production'
 
 __all__ = ['spectral_locus_visual', 'chromaticity_diagram_construction_visual']
 
+_SPECTRAL_LOCUS_CACHE = {}
+"""
+Cache for the spectral locus points and colours.
+
+_SPECTRAL_LOCUS_CACHE : dict
+"""
+
+
+def _spectral_locus(cmfs, reference_colourspace):
+    """
+    Returns the spectral locus points in given reference colourspace and their
+    colours.
+
+    Parameters
+    ----------
+    cmfs : unicode or array_like
+        Standard observer colour matching functions defining the spectral
+        locus.
+    reference_colourspace : unicode
+        Reference colourspace to convert the spectral locus to.
+
+    Returns
+    -------
+    tuple
+        Spectral locus points and *sRGB* colours clipped to range [0, 1].
+
+    Notes
+    -----
+    -   The spectral locus is cached per resolved standard observer colour
+        matching functions name and reference colourspace, the returned
+        arrays are shared and must be copied before being modified.
+    -   The points have as many columns as the reference colourspace, e.g.
+        two for the chromaticity diagrams ones.
+
+    Examples
+    --------
+    >>> points, RGB = _spectral_locus(  # doctest: +SKIP
+    ...     'CIE 1931 2 Degree Standard Observer', 'CIE UCS uv')
+    >>> points.shape, RGB.shape  # doctest: +SKIP
+    ((472, 2), (472, 3))
+    """
+
+    # The colour matching functions are resolved first, they can be given as
+    # unhashable patterns.
+    cmfs = first_item(filter_cmfs(cmfs).values())
+
+    key = (cmfs.name, reference_colourspace)
+    spectral_locus = _SPECTRAL_LOCUS_CACHE.get(key)
+    if spectral_locus is not None:
+        return spectral_locus
+
+    XYZ = cmfs.values
+
+    illuminant = DEFAULT_PLOTTING_ILLUMINANT
+
+    # The conversions are per sample, the spectral locus is closed by copying
+    # the first converted sample rather than converting it twice. The points
+    # are allocated after the conversion as the chromaticity diagrams
+    # reference colourspaces only have two columns.
+    converted = colourspace_model_axis_reorder(
+        XYZ_to_colourspace_model(XYZ, illuminant, reference_colourspace),
+        reference_colourspace)
+    points = np.empty((converted.shape[0] + 1, converted.shape[-1]),
+                      dtype=np.float32)
+    points[:-1] = converted
+    points[-1] = points[0]
+    np.nan_to_num(points, copy=False)
+
+    RGB = np.empty((XYZ.shape[0] + 1, 3), dtype=DEFAULT_FLOAT_DTYPE)
+    RGB[:-1] = normalise_maximum(XYZ_to_sRGB(XYZ, illuminant), axis=-1)
+    RGB[-1] = RGB[0]
+    np.clip(RGB, 0, 1, out=RGB)
+
+    spectral_locus = _SPECTRAL_LOCUS_CACHE[key] = (points, RGB)
+
+    return spectral_locus
+
 
 def spectral_locus_visual(reference_colourspace='CIE xyY',
                           cmfs='CIE 1931 2 Degree Standard Observer',
@@ -74,28 +151,19 @@ def spectral_locus_visual(reference_colourspace='CIE xyY',
         Spectral locus visual.
     """
 
-    cmfs = first_item(filter_cmfs(cmfs).values())
-    XYZ = cmfs.values
-
-    XYZ = np.vstack([XYZ, XYZ[0, ...]])
-
-    illuminant = DEFAULT_PLOTTING_ILLUMINANT
-
-    points = colourspace_model_axis_reorder(
-        XYZ_to_colourspace_model(XYZ, illuminant, reference_colourspace),
-        reference_colourspace)
-    points[np.isnan(points)] = 0
+    points, RGB = _spectral_locus(cmfs, reference_colourspace)
 
     if uniform_colour is None:
-        RGB = normalise_maximum(XYZ_to_sRGB(XYZ, illuminant), axis=-1)
-        RGB = np.hstack([RGB,
-                         np.full((RGB.shape[0], 1), uniform_opacity,
-                                 DEFAULT_FLOAT_DTYPE)])
+        RGBA = np.empty((RGB.shape[0], 4), DEFAULT_FLOAT_DTYPE)
+        RGBA[..., 0:3] = RGB
+        RGBA[..., 3] = np.clip(uniform_opacity, 0, 1)
+        RGB = RGBA
     else:
-        RGB = ColorArray(uniform_colour, alpha=uniform_opacity).rgba
+        RGB = RGBA_colour(uniform_colour, uniform_opacity)
+        np.clip(RGB, 0, 1, out=RGB)
 
     line = Line(
-        points, np.clip(RGB, 0, 1), width=width, method=method, parent=parent)
+        np.copy(points), RGB, width=width, method=method, parent=parent)
 
     return line
 